@@ -1,5 +1,5 @@
 from flask import Flask, request, jsonify
-from generate_pdf_report import generate_interview_report
+from generate_pdf_report import generate_interview_report, generate_team_report
 
 
 app = Flask(__name__)
@@ -19,5 +19,21 @@ def generate_pdf_endpoint():
         return error
 
 
+@app.route("/leadership_reporting/generate_team_report_pdf", methods=["POST"])
+def generate_team_pdf_endpoint():
+    try:
+        payload = request.get_json()
+        result = jsonify(
+            generate_team_report(payload["candidates"], payload["team_profile"])
+        )
+        result.status_code = 200
+        return result
+    except Exception as e:
+        error_message = str(e)
+        error = jsonify({"error": error_message})
+        error.status_code = 500
+        return error
+
+
 if __name__ == "__main__":
     app.run()
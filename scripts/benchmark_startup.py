@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import pathlib
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import urllib.error
+import urllib.request
+from statistics import median
+
+from generate_pdf_report import _load_focus_areas, _render_team_report
+from server import _fork_worker, _prepare_server
+
+# a request that goes through flask and the payload validation without writing a report
+PATH_SAMPLE_REQUEST = "/leadership_reporting/generate_interview_questions_pdf"
+
+# renders a one member team report (everything but the PDF) in a fresh interpreter
+COLD_RENDER_STATEMENT = """
+import pathlib, tempfile
+from generate_pdf_report import _load_focus_areas, _render_team_report
+payload = {skill: 6.5 for skills in _load_focus_areas().values() for skill in skills}
+payload["candidate_profile"] = {"name": "employee name", "company_name": "company"}
+with tempfile.TemporaryDirectory() as tmp_dir:
+    _render_team_report([payload], {"name": "team", "company_name": "company"}, pathlib.Path(tmp_dir))
+"""
+
+
+def build_sample_payload() -> dict:
+    """
+    Create a payload for one candidate with a score for every skill
+
+    Args:
+        None
+
+    Returns:
+        dict: the candidate's profile and assessment results
+    """
+    payload = {
+        skill: 6.5
+        for list_skills in _load_focus_areas().values()
+        for skill in list_skills
+    }
+    payload["candidate_profile"] = {"name": "employee name", "company_name": "company"}
+    return payload
+
+
+def send_sample_request(port: int, timeout: float = 30) -> None:
+    """
+    POST the sample payload to the server on localhost, retrying until it accepts connections
+
+    Args:
+        param1(int): the port the server listens on
+        optional_arg(float): seconds to wait for the server before giving up
+
+    Returns:
+        None
+
+    Raises:
+        TimeoutError: the server didn't answer in time
+        urllib.error.HTTPError: the server answered with an error
+    """
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}{PATH_SAMPLE_REQUEST}",
+        data=json.dumps(build_sample_payload()).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+            return
+        except urllib.error.HTTPError:
+            raise
+        except (ConnectionError, urllib.error.URLError):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"no response from port {port} after {timeout}s")
+            time.sleep(0.01)
+
+
+def benchmark_cold_start(statement: str, repeat: int) -> float:
+    """
+    Time a fresh python interpreter running the statement from the scripts folder
+
+    Args:
+        param1(str): the python statement to run, e.g. "import app"
+        param2(int): the number of runs
+
+    Returns:
+        float: the median wall time in milliseconds
+    """
+    path_scripts = pathlib.Path(__file__).parent
+
+    list_timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=path_scripts, check=True)
+        list_timings.append((time.perf_counter() - start) * 1000)
+
+    return median(list_timings)
+
+
+def benchmark_cold_server(repeat: int) -> float:
+    """
+    Time how long a freshly started server.py with one worker takes to answer its first request
+
+    Args:
+        param1(int): the number of runs
+
+    Returns:
+        float: the median time in milliseconds
+    """
+    path_server = pathlib.Path(__file__).parent / "server.py"
+
+    list_timings = []
+    for _ in range(repeat):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, path_server, "--port", str(port), "--workers", "1"],
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            send_sample_request(port, timeout=120)
+            list_timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait()
+
+    return median(list_timings)
+
+
+def benchmark_fork_server(repeat: int) -> float:
+    """
+    Time how long a worker forked off this process, preloaded the way server.py does it, takes
+    to answer its first request
+
+    Args:
+        param1(int): the number of forks
+
+    Returns:
+        float: the median time in milliseconds
+    """
+    server = _prepare_server("127.0.0.1", 0)
+
+    list_timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pid = _fork_worker(server)
+        try:
+            send_sample_request(server.server_port)
+            list_timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+
+    server.server_close()
+    return median(list_timings)
+
+
+def benchmark_fork_render(repeat: int) -> float:
+    """
+    Time how long a worker forked off this (preloaded) process takes to render its first one
+    member team report, from the fork until the worker reports back over a pipe
+
+    Args:
+        param1(int): the number of forks
+
+    Returns:
+        float: the median time in milliseconds
+    """
+    list_timings = []
+    for _ in range(repeat):
+        read_fd, write_fd = os.pipe()
+
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    _render_team_report(
+                        [build_sample_payload()],
+                        {"name": "team", "company_name": "company"},
+                        pathlib.Path(tmp_dir),
+                    )
+                os.write(write_fd, b"1")
+            except Exception:
+                traceback.print_exc()
+                os._exit(1)
+            os._exit(0)
+
+        os.close(write_fd)
+        try:
+            if os.read(read_fd, 1) != b"1":
+                raise RuntimeError("the forked worker failed to render the report")
+            list_timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            os.waitpid(pid, 0)
+            os.close(read_fd)
+
+    return median(list_timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure how long the reporting service takes to start a worker"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    dict_results = {
+        "python interpreter": benchmark_cold_start("pass", args.repeat),
+        "import generate_pdf_report": benchmark_cold_start(
+            "import generate_pdf_report", args.repeat
+        ),
+        "import app": benchmark_cold_start("import app", args.repeat),
+        "import app + preload": benchmark_cold_start(
+            "import app, generate_pdf_report; generate_pdf_report.preload()",
+            args.repeat,
+        ),
+        "cold server.py, first response": benchmark_cold_server(args.repeat),
+        "cold interpreter, first render": benchmark_cold_start(
+            COLD_RENDER_STATEMENT, args.repeat
+        ),
+    }
+
+    # forks inherit everything preloaded by _prepare_server
+    dict_results["forked worker, first response"] = benchmark_fork_server(
+        args.repeat * 4
+    )
+    dict_results["forked worker, first render"] = benchmark_fork_render(args.repeat)
+
+    for name, timing in dict_results.items():
+        print(f"{name:<34}{timing:>10.1f} ms")
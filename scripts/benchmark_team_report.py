@@ -0,0 +1,149 @@
+import argparse
+import pathlib
+import random
+import re
+import tempfile
+import time
+from typing import Dict, List, Union
+
+from generate_pdf_report import _load_focus_areas, _render_team_report
+
+
+def build_team_payloads(
+    team_size: int, seed: int = 0
+) -> List[Dict[str, Dict[str, Union[float, int]]]]:
+    """
+    Create payloads with random scores, in steps of 0.5 like the real assessments, for a team
+
+    Args:
+        param1(int): the number of candidates
+        optional_arg(int): seed for the random scores
+
+    Returns:
+        List[Dict[str, Dict[str, Union[float, int]]]]: one payload per candidate
+    """
+    rng = random.Random(seed)
+    list_scores = [step / 2 for step in range(2, 21)]
+
+    list_payloads = []
+    for i in range(team_size):
+        payload = {
+            skill: rng.choice(list_scores)
+            for list_skills in _load_focus_areas().values()
+            for skill in list_skills
+        }
+        payload["candidate_profile"] = {
+            "name": f"employee {i}",
+            "company_name": "company name",
+        }
+        list_payloads.append(payload)
+
+    return list_payloads
+
+
+def check_images_resolve(path_html_file: pathlib.Path) -> int:
+    """
+    Check that every image referenced by the rendered html file exists
+
+    Args:
+        param1(pathlib.Path): path to the rendered html file
+
+    Returns:
+        int: the number of distinct images referenced
+
+    Raises:
+        FileNotFoundError: an image referenced by the html file doesn't exist
+    """
+    html = path_html_file.read_text()
+    set_images = set(re.findall(r'<img src="([^"]+)"', html))
+    set_images.update(re.findall(r"url\(([^)]+)\)", html))
+
+    for image in set_images:
+        if not (path_html_file.parent / image).is_file():
+            raise FileNotFoundError(f"{path_html_file} references missing image {image}")
+
+    return len(set_images)
+
+
+def benchmark_team_report(team_size: int) -> Dict[str, Union[int, float, None]]:
+    """
+    Render the team report for a team of the given size and measure each stage
+
+    Args:
+        param1(int): the number of candidates
+
+    Returns:
+        Dict[str, Union[int, float, None]]: the time taken to draw the charts and render the html,
+        the number and total size of the images, and the time taken to write the PDF and its size,
+        which are None if weasyprint can't be loaded
+    """
+    list_payloads = build_team_payloads(team_size)
+    dict_team = {"name": "team name", "company_name": "company name"}
+
+    with tempfile.TemporaryDirectory(prefix="team_report_") as tmp_dir:
+        path_tmp = pathlib.Path(tmp_dir)
+
+        start = time.perf_counter()
+        path_html_file = _render_team_report(list_payloads, dict_team, path_tmp)
+        render_seconds = time.perf_counter() - start
+
+        list_images = list(path_tmp.rglob("*.jpg"))
+        dict_result = {
+            "render_seconds": render_seconds,
+            "images_referenced": check_images_resolve(path_html_file),
+            "image_files": len(list_images),
+            "image_bytes": sum(path.stat().st_size for path in list_images),
+            "pdf_seconds": None,
+            "pdf_bytes": None,
+        }
+
+        try:
+            import weasyprint
+        except (ImportError, OSError):
+            # weasyprint needs pango installed on the system
+            return dict_result
+
+        path_pdf_report = path_tmp / "team_report.pdf"
+        start = time.perf_counter()
+        weasyprint.HTML(path_html_file).write_pdf(path_pdf_report)
+        dict_result["pdf_seconds"] = time.perf_counter() - start
+        dict_result["pdf_bytes"] = path_pdf_report.stat().st_size
+
+    return dict_result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure how the team report's generation time and size grow with team size"
+    )
+    parser.add_argument("--team-sizes", type=int, nargs="+", default=[1, 5, 20])
+    args = parser.parse_args()
+
+    print(
+        f"{'members':>8}{'render s':>10}{'images':>8}{'image KB':>10}"
+        f"{'pdf s':>8}{'pdf KB':>8}{'total s vs N x 1':>18}"
+    )
+
+    dict_baseline = None
+    for team_size in args.team_sizes:
+        dict_result = benchmark_team_report(team_size)
+        total_seconds = dict_result["render_seconds"] + (dict_result["pdf_seconds"] or 0)
+        if dict_baseline is None:
+            dict_baseline = {"team_size": team_size, "total_seconds": total_seconds}
+
+        linear_seconds = (
+            dict_baseline["total_seconds"] * team_size / dict_baseline["team_size"]
+        )
+        pdf_seconds = dict_result["pdf_seconds"]
+        pdf_bytes = dict_result["pdf_bytes"]
+
+        print(
+            f"{team_size:>8}{dict_result['render_seconds']:>10.2f}"
+            f"{dict_result['image_files']:>8}{dict_result['image_bytes'] / 1024:>10.0f}"
+            f"{'n/a' if pdf_seconds is None else f'{pdf_seconds:.2f}':>8}"
+            f"{'n/a' if pdf_bytes is None else f'{pdf_bytes / 1024:.0f}':>8}"
+            f"{total_seconds / linear_seconds:>18.2f}"
+        )
+
+    if pdf_seconds is None:
+        print("weasyprint could not be loaded, so the PDF was not written or measured")
@@ -2,20 +2,23 @@ from typing import Dict, Union, List, Tuple
 from textwrap import wrap
 import pathlib
 import json
+import csv
 import os
 import shutil
+import tempfile
+import functools
+import importlib
+import threading
 import datetime as dt
 from statistics import mean
-import pandas as pd
-import numpy as np
-import matplotlib
 
-matplotlib.use("Agg")
-from matplotlib import pyplot as plt
-import matplotlib.colors as mcolors
-from PIL import Image
-import weasyprint
-from jinja2 import Environment, FileSystemLoader
+# numpy, matplotlib, PIL, weasyprint and jinja2 take seconds to import, so they are imported
+# inside the functions that use them to keep importing this module (and starting app.py) fast.
+# Call preload() to import and warm them up front, e.g. before forking workers
+
+# pyplot keeps the current figure and the rc settings as process-wide state, so only one thread
+# at a time may draw charts (app.run() serves requests on multiple threads)
+_chart_lock = threading.Lock()
 
 
 def generate_interview_report(payload: Dict[str, Dict[str, Union[float, int]]]) -> None:
@@ -48,6 +51,84 @@ def generate_interview_report(payload: Dict[str, Dict[str, Union[float, int]]])
     # _delete_temp_files()
 
 
+def generate_team_report(
+    list_payloads: List[Dict[str, Dict[str, Union[float, int]]]],
+    dict_team: Dict[str, str],
+) -> None:
+    """
+    Generate a single leadership report covering a whole team
+
+    The introduction, skill descriptions, development guidance, disclaimer and background image
+    are rendered once for the whole team. Each candidate gets their own overview and charts, and
+    a team spider plot overlays every candidate's focus area scores
+
+    Args:
+        param1(List[Dict[str, Dict[str, int | str]]]): each candidate's profile and assessment results
+        param2(Dict[str, str]): the team's profile consisting of the team name and company name
+
+    Returns:
+        None
+
+    Raises:
+        TypeError: Must receieve a non-empty list of nested dictionaries as an argument, each with
+        a candidate_profile and a score for at least one skill of every focus area
+
+    Notes:
+        The PDF report generated is stored in the results directory as team_<name>_<company>_<date>.pdf
+    """
+    if not isinstance(list_payloads, list) or not list_payloads:
+        raise TypeError("Input must be a non-empty list of nested dictionaries")
+
+    for index, payload in enumerate(list_payloads):
+        _validate_payload(payload)
+        _validate_team_member_payload(payload, index)
+    _validate_payload(dict_team)
+    _validate_profile(dict_team, "Team profile")
+
+    # every call gets its own folder so that concurrent requests don't share images or html, the
+    # charts themselves are drawn one request at a time under _chart_lock
+    with tempfile.TemporaryDirectory(prefix="team_report_") as tmp_dir:
+        path_html_file = _render_team_report(
+            list_payloads, dict_team, pathlib.Path(tmp_dir)
+        )
+        _generate_pdf(dict_team, path_html_file, report_prefix="team")
+
+
+def preload() -> None:
+    """
+    Import the plotting and PDF libraries and warm up the fonts, templates and content catalog
+    so that the first report generated, or any process forked afterwards, doesn't pay for it
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    _load_focus_areas()
+    _load_skills_text()
+    _load_skill_range()
+
+    env = _get_template_environment()
+    env.get_template("pilot.html")
+    env.get_template("team.html")
+
+    # only imported to warm the module cache, the functions using them import them again
+    importlib.import_module("numpy")
+    importlib.import_module("PIL.Image")
+
+    # drawing a figure builds matplotlib's font cache and loads the Agg renderer
+    plt = _get_pyplot()
+    fig = plt.figure()
+    fig.canvas.draw()
+    plt.close(fig)
+
+    # rendering a document loads fontconfig/pango and weasyprint's default stylesheets
+    import weasyprint
+
+    weasyprint.HTML(string="<p>preload</p>").write_pdf()
+
+
 def _validate_payload(
     payload: Dict[str, Union[str, Dict[str, Union[float, int, str, bool, None]]]]
 ) -> None:
@@ -88,6 +169,170 @@ def _validate_payload(
                 )
 
 
+def _validate_team_member_payload(
+    payload: Dict[str, Union[str, Dict[str, Union[float, int, str, bool, None]]]],
+    index: int,
+) -> None:
+    """
+    Check that a team member's payload has everything the team report needs, after it has passed
+    _validate_payload
+
+    Args:
+        param1(Dict[str, Union[str, Dict[str, Union[float, int, str, bool, None]]]]): The candidate's profile and assessment results
+        param2(int): the candidate's position in the team, used in the error message
+
+    Returns:
+        None
+
+    Raises:
+        TypeError: Must have a candidate_profile with a name and company_name, numeric scores,
+        and a score for at least one skill of every focus area
+    """
+    _validate_profile(
+        payload.get("candidate_profile"), f"Candidate {index}'s candidate_profile"
+    )
+
+    dict_scores = {
+        skill: score for skill, score in payload.items() if skill != "candidate_profile"
+    }
+    for skill, score in dict_scores.items():
+        if isinstance(score, bool) or not isinstance(score, (float, int)):
+            raise TypeError(
+                f"Candidate {index} must have scores as int or float, {skill} is not"
+            )
+
+    for focus_area, dict_skills in _modify_scores(dict_scores).items():
+        if not dict_skills:
+            raise TypeError(
+                f"Candidate {index} must have a score for at least one skill of the {focus_area} focus area"
+            )
+
+
+def _validate_profile(dict_profile: Dict[str, str], owner: str) -> None:
+    """
+    Check that a candidate or team profile is a dictionary with a name and company_name as string
+
+    Args:
+        param1(Dict[str, str]): the profile to check
+        param2(str): which profile it is, used in the error message, e.g. "Team profile"
+
+    Returns:
+        None
+
+    Raises:
+        TypeError: Must be a dictionary with a name and company_name as string
+    """
+    if not isinstance(dict_profile, dict) or not all(
+        isinstance(dict_profile.get(field), str) for field in ("name", "company_name")
+    ):
+        raise TypeError(
+            f"{owner} must be a dictionary with a name and company_name as string"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_focus_areas() -> Dict[str, List[str]]:
+    """
+    Load the focus areas and their skills from focus_area.json, cached for the life of the process
+
+    The result is shared by every caller, so callers must not mutate it
+
+    Args:
+        None
+
+    Returns:
+        Dict[str, List[str]]: dictionary mapping each focus area to its skills
+    """
+    path_focus_area = (
+        pathlib.Path(__file__).parent.parent / "resources" / "focus_area.json"
+    )
+    with open(path_focus_area) as file:
+        return json.load(file)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_skills_text() -> Dict[str, Dict[str, Union[str, List[str]]]]:
+    """
+    Load the text for every skill from skills.json, cached for the life of the process
+
+    The result is shared by every caller, so callers must not mutate it
+
+    Args:
+        None
+
+    Returns:
+        Dict[str, Dict[str, Union[str, List[str]]]]: dictionary mapping each skill to its text
+    """
+    path_skills_json = (
+        pathlib.Path(__file__).parent.parent / "resources" / "skills.json"
+    )
+    with open(path_skills_json) as file:
+        return json.load(file)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_skill_range() -> Dict[str, Dict[str, float]]:
+    """
+    Load the gauge ranges for every skill from skill_range.csv, cached for the life of the process
+
+    The result is shared by every caller, so callers must not mutate it
+
+    Args:
+        None
+
+    Returns:
+        Dict[str, Dict[str, float]]: dictionary mapping each skill to its Min, Max, R1 and R2 values
+    """
+    path_skill_range = (
+        pathlib.Path(__file__).parent.parent / "resources" / "skill_range.csv"
+    )
+    # the csv file starts with a byte order mark
+    with open(path_skill_range, encoding="utf-8-sig") as csv_file:
+        reader = csv.DictReader(csv_file)
+        return {
+            row["skills"]: {
+                field: float(value) for field, value in row.items() if field != "skills"
+            }
+            for row in reader
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template_environment():
+    """
+    Create the jinja2 environment for the templates folder. The environment keeps the compiled
+    templates, so it is cached for the life of the process
+
+    Args:
+        None
+
+    Returns:
+        jinja2.Environment: environment that loads templates from the templates folder
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    path_templates = pathlib.Path(__file__).parent.parent / "templates"
+    return Environment(loader=FileSystemLoader(path_templates))
+
+
+def _get_pyplot():
+    """
+    Import pyplot using the non-interactive Agg backend
+
+    Args:
+        None
+
+    Returns:
+        module: matplotlib.pyplot
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    return plt
+
+
 def _modify_scores(
     dict_scores: Dict[str, Union[float, int]]
 ) -> Dict[str, Dict[str, Union[float, int]]]:
@@ -100,11 +345,7 @@ def _modify_scores(
     Returns:
         Dict[str, Dict[str, Union[float, int]]]:
     """
-    path_focus_area = (
-        pathlib.Path(__file__).parent.parent / "resources" / "focus_area.json"
-    )
-    with open(path_focus_area) as file:
-        dict_focus_area = json.load(file)
+    dict_focus_area = _load_focus_areas()
 
     dict_modified_scores = {key: {} for key in dict_focus_area.keys()}
 
@@ -116,20 +357,28 @@ def _modify_scores(
     return dict_modified_scores
 
 
-def _generate_bar_charts(dict_scores: Dict[str, Dict[str, Union[float, int]]]) -> None:
+def _generate_bar_charts(
+    dict_scores: Dict[str, Dict[str, Union[float, int]]], path_tmp: pathlib.Path = None
+) -> None:
     """
     Creates bar graphs for all focus areas based on the individual's self-assessment and save the
     static image to the tmp folder
 
     Args:
         param1(Dict[str, Dict[str, int | str]]): The candidate's profile and assessment results
+        optional_arg(pathlib.Path): folder where the images are saved, defaults to the tmp folder
 
     Returns:
         None
     """
+    plt = _get_pyplot()
+
+    if path_tmp is None:
+        path_tmp = pathlib.Path(__file__).parent / "tmp"
+
     for focus_area, dict_skills in dict_scores.items():
         filename_ending = focus_area + ".jpg"
-        path_focus_area = pathlib.Path(__file__).parent / "tmp" / filename_ending
+        path_focus_area = path_tmp / filename_ending
 
         categories = ["\n".join(category.split(" ")) for category in dict_skills.keys()]
         values = list(dict_skills.values())
@@ -154,9 +403,7 @@ def _generate_bar_charts(dict_scores: Dict[str, Dict[str, Union[float, int]]]) -
         plt.yticks([])
         plt.tight_layout()
         plt.savefig(path_focus_area, format="jpg")
-        plt.clf()
-
-    matplotlib.pyplot.close()
+        plt.close(fig)
 
 
 def _generate_spider_plot(dict_scores: Dict[str, Dict[str, Union[float, int]]]) -> None:
@@ -170,6 +417,12 @@ def _generate_spider_plot(dict_scores: Dict[str, Dict[str, Union[float, int]]])
     Returns:
         None
     """
+    import numpy as np
+    import matplotlib
+    from PIL import Image
+
+    plt = _get_pyplot()
+
     categories = ["\n".join(wrap(category, 15)) for category in dict_scores.keys()]
 
     list_scores = [mean(skills.values()) for skills in dict_scores.values()]
@@ -244,7 +497,8 @@ def _generate_spider_plot(dict_scores: Dict[str, Dict[str, Union[float, int]]])
 
 
 def _generate_colorbar_plots(
-    dict_scores: Dict[str, Dict[str, Union[float, int]]]
+    dict_scores: Dict[str, Dict[str, Union[float, int]]],
+    path_tmp: pathlib.Path = None,
 ) -> None:
     """
     Creates horizontal gauge charts based on the individual's scores.
@@ -252,14 +506,21 @@ def _generate_colorbar_plots(
     Args:
         param(Dict[str, Dict[str, Union[float, int]]]): a nested dictionary that corresponds
         to the score receieved for each focus area/skill
+        optional_arg(pathlib.Path): folder where the images are saved, defaults to the tmp folder
 
     Returns:
         None
     """
-    path_skill_range = (
-        pathlib.Path(__file__).parent.parent / "resources" / "skill_range.csv"
-    )
-    df_skill_range = pd.read_csv(path_skill_range)
+    import numpy as np
+    import matplotlib
+    import matplotlib.colors as mcolors
+
+    plt = _get_pyplot()
+
+    if path_tmp is None:
+        path_tmp = pathlib.Path(__file__).parent / "tmp"
+
+    dict_skill_range = _load_skill_range()
 
     fig = plt.figure(figsize=(8, 2))
     ax = fig.add_axes([0.1, 0.2, 0.8, 0.4])
@@ -293,18 +554,10 @@ def _generate_colorbar_plots(
 
     for skill_dict in dict_scores.values():
         for skill, score in skill_dict.items():
-            min_gauge_value = df_skill_range.loc[
-                df_skill_range["skills"] == skill, "Min"
-            ].values[0]
-            max_gauge_value = df_skill_range.loc[
-                df_skill_range["skills"] == skill, "Max"
-            ].values[0]
-            r1_gauge_value = df_skill_range.loc[
-                df_skill_range["skills"] == skill, "R1"
-            ].values[0]
-            r2_gauge_value = df_skill_range.loc[
-                df_skill_range["skills"] == skill, "R2"
-            ].values[0]
+            min_gauge_value = dict_skill_range[skill]["Min"]
+            max_gauge_value = dict_skill_range[skill]["Max"]
+            r1_gauge_value = dict_skill_range[skill]["R1"]
+            r2_gauge_value = dict_skill_range[skill]["R2"]
 
             guage_range = np.linspace(min_gauge_value, max_gauge_value, 512)
 
@@ -345,7 +598,7 @@ def _generate_colorbar_plots(
             ax3.axvspan(score - 0.1, score + 0.1, 0, 1, facecolor="#000000")
 
             file_name = skill + ".jpg"
-            path_skill_gauge_chart = pathlib.Path(__file__).parent / "tmp" / file_name
+            path_skill_gauge_chart = path_tmp / file_name
 
             ax.set_xticks([])
             ax2.set_xticks([])
@@ -375,13 +628,19 @@ def _generate_colorbar_plots(
             annotation2.remove()
             annotation3.remove()
 
+    plt.close(fig)
 
-def _save_background_pic(old_path_background_pic=None) -> None:
+
+def _save_background_pic(
+    old_path_background_pic=None, new_path_background_pic=None
+) -> None:
     """
     Save the background picture to the /tmp folder in order to be referenced by the html file
 
     Args:
-        optional_arg (pathlib.Path): path to background picture
+        optional_arg1 (pathlib.Path): path to background picture
+        optional_arg2 (pathlib.Path): where the background picture is copied to, defaults to
+        the tmp folder
 
     Returns:
         None
@@ -392,7 +651,10 @@ def _save_background_pic(old_path_background_pic=None) -> None:
             pathlib.Path(__file__).parent.parent / "resources" / "background.jpg"
         )
 
-    new_path_background_pic = pathlib.Path(__file__).parent / "tmp" / "background.jpg"
+    if new_path_background_pic is None:
+        new_path_background_pic = (
+            pathlib.Path(__file__).parent / "tmp" / "background.jpg"
+        )
     shutil.copy(old_path_background_pic, new_path_background_pic)
 
 
@@ -429,9 +691,7 @@ def _generate_html(
     Returns:
         None
     """
-    path_templates = pathlib.Path(__file__).parent.parent / "templates"
-    env = Environment(loader=FileSystemLoader(path_templates))
-    template = env.get_template("pilot.html")
+    template = _get_template_environment().get_template("pilot.html")
 
     dict_bottom_top_skills = _get_bottom_and_top_skills(dict_scores)
 
@@ -492,11 +752,7 @@ def _get_text_for_top_and_bottom_skills(
     Returns:
         Dict[str, Dict[str, Dict[str, str]]]: a dictionary that maps top and bottom skills to the respective text
     """
-    path_skills_json = (
-        pathlib.Path(__file__).parent.parent / "resources" / "skills.json"
-    )
-    with open(path_skills_json) as file:
-        dict_skills_text = json.load(file)
+    dict_skills_text = _load_skills_text()
 
     dict_bottom_top_skills_text = {}
     for skill_position, list_skill in dict_bottom_top_skills.items():
@@ -520,17 +776,8 @@ def _get_all_skills_description() -> Dict[str, Dict[str, str]]:
         Dict[str, Dict[str, str]]: dictionary representing all focus areas and their corresponding
         skills and their corresponding descriptions
     """
-    path_skills_json = (
-        pathlib.Path(__file__).parent.parent / "resources" / "skills.json"
-    )
-    with open(path_skills_json) as file:
-        dict_skills_text = json.load(file)
-
-    path_focus_area_json = (
-        pathlib.Path(__file__).parent.parent / "resources" / "focus_area.json"
-    )
-    with open(path_focus_area_json) as file:
-        dict_focus_area = json.load(file)
+    dict_skills_text = _load_skills_text()
+    dict_focus_area = _load_focus_areas()
 
     dict_skills_text_cleaned = {key: {} for key in dict_focus_area.keys()}
 
@@ -543,12 +790,18 @@ def _get_all_skills_description() -> Dict[str, Dict[str, str]]:
     return dict_skills_text_cleaned
 
 
-def _generate_pdf(dict_candidate: Dict[str, str]) -> None:
+def _generate_pdf(
+    dict_candidate: Dict[str, str],
+    path_html_file: pathlib.Path = None,
+    report_prefix: str = None,
+) -> None:
     """
     Creates the final PDF file and saves to the results folder
 
     Args:
         param1(Dict[str, int | str]]): The candidate's profile
+        optional_arg1(pathlib.Path): the rendered html file, defaults to the one in the tmp folder
+        optional_arg2(str): prefix for the report's filename, e.g. "team"
 
     Returns:
         None
@@ -558,14 +811,266 @@ def _generate_pdf(dict_candidate: Dict[str, str]) -> None:
     ].replace(" ", "_")
     date_today_string = dt.date.today().strftime("%Y-%m-%d")
     report_filename = "_".join([name, company, date_today_string])
+    if report_prefix is not None:
+        report_filename = "_".join([report_prefix, report_filename])
     report_filename += ".pdf"
 
-    path_html_file = pathlib.Path(__file__).parent / "tmp" / "rendered_template.html"
+    if path_html_file is None:
+        path_html_file = (
+            pathlib.Path(__file__).parent / "tmp" / "rendered_template.html"
+        )
     path_pdf_report = pathlib.Path(__file__).parent.parent / "results" / report_filename
 
+    import weasyprint
+
     weasyprint.HTML(path_html_file).write_pdf(path_pdf_report)
 
 
+def _render_team_report(
+    list_payloads: List[Dict[str, Dict[str, Union[float, int]]]],
+    dict_team: Dict[str, str],
+    path_team_tmp: pathlib.Path,
+) -> pathlib.Path:
+    """
+    Generate every chart of the team report and render its html file into the given folder
+
+    Args:
+        param1(List[Dict[str, Dict[str, int | str]]]): each candidate's profile and assessment results
+        param2(Dict[str, str]): the team's profile consisting of the team name and company name
+        param3(pathlib.Path): an empty folder where the images and html file are saved
+
+    Returns:
+        pathlib.Path: path to the rendered html file, which references the images relative to it
+    """
+    list_candidates = _build_team_context(list_payloads)
+
+    with _chart_lock:
+        for candidate in list_candidates:
+            path_candidate_tmp = path_team_tmp / str(candidate["index"])
+            path_candidate_tmp.mkdir()
+            _generate_bar_charts(candidate["dict_scores"], path_candidate_tmp)
+
+        dict_gauges = _generate_team_colorbar_plots(
+            list_candidates, path_team_tmp / "gauges"
+        )
+        _generate_team_spider_plot(
+            list_candidates, path_team_tmp / "team_spider_plot.jpg"
+        )
+    _save_background_pic(new_path_background_pic=path_team_tmp / "background.jpg")
+
+    path_html_file = path_team_tmp / "rendered_template.html"
+    _generate_team_html(dict_team, list_candidates, dict_gauges, path_html_file)
+
+    return path_html_file
+
+
+def _build_team_context(
+    list_payloads: List[Dict[str, Dict[str, Union[float, int]]]]
+) -> List[Dict[str, Union[int, Dict]]]:
+    """
+    Split every payload into the candidate's profile and scores, and compute the modified scores
+    and top/bottom skills for the whole team in one pass
+
+    Args:
+        param1(List[Dict[str, Dict[str, int | str]]]): each candidate's profile and assessment results
+
+    Returns:
+        List[Dict[str, Union[int, Dict]]]: one dictionary per candidate consisting of their index,
+        profile, modified scores and bottom 3/top 3 skills
+    """
+    list_candidates = []
+    for i, payload in enumerate(list_payloads):
+        dict_scores = {
+            skill: score
+            for skill, score in payload.items()
+            if skill != "candidate_profile"
+        }
+        dict_modified_scores = _modify_scores(dict_scores)
+
+        list_candidates.append(
+            {
+                "index": i,
+                "dict_candidate": payload["candidate_profile"],
+                "dict_scores": dict_modified_scores,
+                "dict_bottom_top_skills": _get_bottom_and_top_skills(
+                    dict_modified_scores
+                ),
+            }
+        )
+
+    return list_candidates
+
+
+def _generate_team_colorbar_plots(
+    list_candidates: List[Dict[str, Union[int, Dict]]], path_gauges: pathlib.Path
+) -> Dict[str, Dict[str, str]]:
+    """
+    Creates the horizontal gauge charts for every candidate in the team. A gauge only shows the
+    skill's range and the score, so each distinct (min, max, score) is drawn once and shared by
+    every skill and candidate with that range and score
+
+    Args:
+        param1(List[Dict[str, Union[int, Dict]]]): the team context from _build_team_context
+        param2(pathlib.Path): folder where the gauge charts are saved
+
+    Returns:
+        Dict[str, Dict[str, str]]: dictionary mapping each skill and score (as a string) to the
+        path of its gauge chart, relative to the parent of path_gauges
+    """
+    dict_skill_range = _load_skill_range()
+
+    dict_gauges = {}
+    dict_drawn_gauges = {}
+    for candidate in list_candidates:
+        for skill_dict in candidate["dict_scores"].values():
+            for skill, score in skill_dict.items():
+                gauge_name = "_".join(
+                    [
+                        str(dict_skill_range[skill]["Min"]),
+                        str(dict_skill_range[skill]["Max"]),
+                        str(score),
+                    ]
+                )
+
+                if gauge_name not in dict_drawn_gauges:
+                    path_gauge = path_gauges / gauge_name
+                    path_gauge.mkdir(parents=True)
+                    _generate_colorbar_plots({gauge_name: {skill: score}}, path_gauge)
+                    dict_drawn_gauges[gauge_name] = "/".join(
+                        [path_gauges.name, gauge_name, skill + ".jpg"]
+                    )
+
+                dict_gauges.setdefault(skill, {})[str(score)] = dict_drawn_gauges[
+                    gauge_name
+                ]
+
+    return dict_gauges
+
+
+def _generate_team_spider_plot(
+    list_candidates: List[Dict[str, Union[int, Dict]]],
+    path_spiderplot_graph: pathlib.Path,
+) -> None:
+    """
+    Creates a spiderplot graph that overlays the focus area scores of every candidate in the team
+    along with the team average
+
+    Args:
+        param1(List[Dict[str, Union[int, Dict]]]): the team context from _build_team_context
+        param2(pathlib.Path): path where the spider plot is saved
+
+    Returns:
+        None
+    """
+    plt = _get_pyplot()
+
+    categories = [
+        "\n".join(wrap(category, 15))
+        for category in list_candidates[0]["dict_scores"].keys()
+    ]
+
+    N = len(categories)
+    PI = 3.14592
+
+    angles = [n / float(N) * 2 * PI for n in range(N)]
+    angles += angles[:1]
+
+    fig = plt.figure(figsize=(10, 10))
+    ax = fig.add_subplot(polar=True)
+
+    ax.set_theta_offset(PI / 2)
+    ax.set_theta_direction(-1)
+
+    ax.set_xticks(angles[:-1], categories, color="black", size=10)
+    ax.tick_params(axis="x", pad=10)
+
+    ax.set_rlabel_position(0)
+    ax.set_yticks([1, 10], ["1", "10"], color="black", size=10)
+    ax.set_ylim(0, 10)
+
+    list_team_scores = []
+    for i, candidate in enumerate(list_candidates):
+        list_scores = [
+            mean(skills.values()) for skills in candidate["dict_scores"].values()
+        ]
+        list_team_scores.append(list_scores)
+        list_scores = list_scores + list_scores[:1]
+
+        color = plt.cm.tab10(i % 10)
+        ax.plot(
+            angles,
+            list_scores,
+            color=color,
+            linewidth=1,
+            linestyle="solid",
+            label=candidate["dict_candidate"]["name"],
+        )
+        ax.fill(angles, list_scores, color=color, alpha=0.1)
+
+    list_mean_scores = [mean(scores) for scores in zip(*list_team_scores)]
+    list_mean_scores = list_mean_scores + list_mean_scores[:1]
+    ax.plot(
+        angles,
+        list_mean_scores,
+        color="black",
+        linewidth=2,
+        linestyle="dashed",
+        label="Team average",
+    )
+
+    ax.legend(loc="upper center", bbox_to_anchor=(0.5, -0.08), ncol=3, fontsize=10)
+
+    fig.savefig(path_spiderplot_graph, format="jpg", bbox_inches="tight")
+    plt.close(fig)
+
+
+def _generate_team_html(
+    dict_team: Dict[str, str],
+    list_candidates: List[Dict[str, Union[int, Dict]]],
+    dict_gauges: Dict[str, Dict[str, str]],
+    path_rendered_template: pathlib.Path,
+) -> None:
+    """
+    Render the html file for the team report by using jinja2 and the team.html file. The skills
+    text is passed once and shared by every candidate's section
+
+    Args:
+        param1(Dict[str, str]): the team's profile consisting of the team name and company name
+        param2(List[Dict[str, Union[int, Dict]]]): the team context from _build_team_context
+        param3(Dict[str, Dict[str, str]]): the gauge chart of each skill and score, from
+        _generate_team_colorbar_plots
+        param4(pathlib.Path): path where the rendered html file is saved
+
+    Returns:
+        None
+    """
+    template = _get_template_environment().get_template("team.html")
+
+    # map each top/bottom skill to the candidates it applies to so its guidance is rendered once
+    dict_team_bottom_top_skills = {"top_skills": {}, "bottom_skills": {}}
+    for candidate in list_candidates:
+        for skill_position, list_skill in candidate["dict_bottom_top_skills"].items():
+            for skill in list_skill:
+                dict_team_bottom_top_skills[skill_position].setdefault(
+                    skill, []
+                ).append(candidate["dict_candidate"]["name"])
+
+    payload = {
+        "dict_team": dict_team,
+        "list_candidates": list_candidates,
+        "dict_gauges": dict_gauges,
+        "dict_team_bottom_top_skills": dict_team_bottom_top_skills,
+        "dict_skills_text": _load_skills_text(),
+        "dict_all_skills_description": _get_all_skills_description(),
+        "date": dt.date.today(),
+    }
+
+    rendered_template = template.render(payload)
+
+    with open(path_rendered_template, "w") as file:
+        file.write(rendered_template)
+
+
 def _delete_temp_files() -> None:
     """
     Deletes all files that were created except for the PDF file (images/graphs and html/css)
@@ -0,0 +1,225 @@
+import argparse
+import gc
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+
+from werkzeug.serving import make_server, BaseWSGIServer
+
+from app import app
+from generate_pdf_report import preload
+
+
+logger = logging.getLogger(__name__)
+
+# a worker that exits with an error sooner than this after being started counts as a startup
+# failure; respawns back off exponentially while they keep failing, and the server gives up after
+# too many failures in a row
+MIN_WORKER_UPTIME_SECONDS = 5
+MAX_RESPAWN_BACKOFF_SECONDS = 30
+MAX_CONSECUTIVE_STARTUP_FAILURES = 5
+
+# on shutdown, workers finish the request they are handling; any still running after this long
+# are killed
+WORKER_SHUTDOWN_TIMEOUT_SECONDS = 10
+
+# how often an idle worker checks whether it has been asked to stop
+WORKER_POLL_SECONDS = 0.5
+
+
+def serve_preforked(host: str, port: int, workers: int) -> None:
+    """
+    Serve the app from worker processes forked off a preloaded parent
+
+    The parent imports the plotting and PDF libraries and warms the fonts, templates and content
+    catalog once, binds the listening socket and then forks the workers, which share everything
+    loaded so far copy-on-write. A worker that exits is replaced by a new fork, which is ready to
+    accept requests as soon as the fork returns
+
+    On SIGTERM or SIGINT the parent asks every worker to stop, waits up to
+    WORKER_SHUTDOWN_TIMEOUT_SECONDS for them to finish the request they are handling and exit,
+    and kills any that are still running
+
+    The workers run Werkzeug's development server on the shared socket, so each worker handles one
+    request at a time and every idle worker wakes up for each new connection while only one of
+    them accepts it. This is a development server, not a production one
+
+    Args:
+        param1(str): the host to listen on
+        param2(int): the port to listen on
+        param3(int): the number of worker processes
+
+    Returns:
+        None
+
+    Raises:
+        SystemExit: exits with status 1 when workers keep failing right after they are started
+    """
+    server = _prepare_server(host, port)
+
+    dict_worker_start_times = {}
+
+    def _stop_workers():
+        for pid in dict_worker_start_times:
+            os.kill(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + WORKER_SHUTDOWN_TIMEOUT_SECONDS
+        while dict_worker_start_times and time.monotonic() < deadline:
+            for pid in list(dict_worker_start_times):
+                try:
+                    reaped_pid, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    # already reaped by the main loop
+                    reaped_pid = pid
+                if reaped_pid:
+                    dict_worker_start_times.pop(pid)
+            time.sleep(0.05)
+
+        for pid in list(dict_worker_start_times):
+            logger.error(
+                "worker %d still running after %ds, killing it",
+                pid,
+                WORKER_SHUTDOWN_TIMEOUT_SECONDS,
+            )
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            dict_worker_start_times.pop(pid)
+
+    def _shutdown(signum, frame):
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        _stop_workers()
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    for _ in range(workers):
+        dict_worker_start_times[_fork_worker(server)] = time.monotonic()
+
+    consecutive_startup_failures = 0
+    list_respawn_times = []
+    while True:
+        # poll rather than block, so that an exit is timed when it happens even while a respawn
+        # is being held back
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            pid, status = 0, 0
+
+        if pid:
+            uptime = time.monotonic() - dict_worker_start_times.pop(pid)
+            exit_code = os.waitstatus_to_exitcode(status)
+
+            if exit_code != 0:
+                logger.error(
+                    "worker %d exited with status %d after %.1fs", pid, exit_code, uptime
+                )
+
+            backoff = 0
+            if exit_code != 0 and uptime < MIN_WORKER_UPTIME_SECONDS:
+                consecutive_startup_failures += 1
+                if consecutive_startup_failures >= MAX_CONSECUTIVE_STARTUP_FAILURES:
+                    logger.error(
+                        "%d workers in a row failed on startup, shutting down",
+                        consecutive_startup_failures,
+                    )
+                    _stop_workers()
+                    sys.exit(1)
+
+                backoff = min(
+                    2 ** (consecutive_startup_failures - 1), MAX_RESPAWN_BACKOFF_SECONDS
+                )
+                logger.info("respawning worker in %ds", backoff)
+            else:
+                consecutive_startup_failures = 0
+
+            list_respawn_times.append(time.monotonic() + backoff)
+
+        now = time.monotonic()
+        for respawn_time in [t for t in list_respawn_times if t <= now]:
+            list_respawn_times.remove(respawn_time)
+            dict_worker_start_times[_fork_worker(server)] = time.monotonic()
+
+        if not pid:
+            time.sleep(0.1)
+
+
+def _prepare_server(host: str, port: int) -> BaseWSGIServer:
+    """
+    Preload the app in this process and bind the listening socket that the workers share
+
+    Args:
+        param1(str): the host to listen on
+        param2(int): the port to listen on, 0 picks a free port
+
+    Returns:
+        BaseWSGIServer: the bound server, ready to be passed to _fork_worker
+    """
+    preload()
+    server = make_server(host, port, app)
+    server.timeout = WORKER_POLL_SECONDS
+
+    # every idle worker is woken up for a new connection, so the ones that lose the race to
+    # accept it must get an error rather than block until the next connection
+    server.socket.setblocking(False)
+
+    # move everything loaded so far out of the garbage collector's reach so that collections in
+    # the workers don't write to (and therefore copy) the pages shared with the parent
+    gc.freeze()
+
+    return server
+
+
+def _fork_worker(server: BaseWSGIServer) -> int:
+    """
+    Fork a worker process that serves requests from the shared listening socket. On SIGTERM the
+    worker finishes the request it is handling and exits with status 0, and it exits with status 1,
+    after logging the error, if serving fails
+
+    Args:
+        param1(BaseWSGIServer): the server bound in the parent process
+
+    Returns:
+        int: the worker's process id
+    """
+    pid = os.fork()
+    if pid == 0:
+        stop_requested = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_requested.set())
+        # Ctrl-C reaches the whole process group, the parent stops the workers itself
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        exit_code = 1
+        try:
+            while not stop_requested.is_set():
+                server.handle_request()
+            exit_code = 0
+        except Exception:
+            logger.exception("worker %d failed", os.getpid())
+        finally:
+            logging.shutdown()
+            os._exit(exit_code)
+
+    return pid
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve the reporting API from workers forked off a preloaded parent"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(process)d %(levelname)s %(message)s"
+    )
+    serve_preforked(args.host, args.port, args.workers)